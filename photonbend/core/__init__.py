@@ -89,5 +89,14 @@ destiny_projection.image = destiny_image_arr
 
 ...
 
+```
+
+### Mapping a band of rows at a time
+The projection classes of photonbend.core.projection also provide a `project` method
+that does the steps above, including an optional rotation, without ever building the
+whole coordinate map. It maps the destiny image a band of rows at a time, which keeps
+memory usage low on large images.
+```
+destiny_image_arr = destiny_projection.project(source_projection, rotation)
 ```
 """
@@ -72,7 +72,18 @@ def _rectilinear_inverse(
     return theta
 
 
-# TODO fix this function so it works with numpy arrays
+# The largest incidence angle the rectilinear lens can handle
+_RECTILINEAR_MAX_THETA = to_radians(89)
+
+
+def _rectilinear_kernel(theta: UniFloat) -> UniFloat:
+    """The unchecked rectilinear function.
+
+    Only meant to be called by _rectilinear, after it validates theta.
+    """
+    return np.tan(theta)
+
+
 def _rectilinear(theta: UniFloat) -> UniFloat:
     """Mapping that uses the angle tangent.
 
@@ -82,26 +93,37 @@ def _rectilinear(theta: UniFloat) -> UniFloat:
     degrees.
 
     Args:
-        theta:
+        theta: either a float or numpy array containing floats representing the
+            incidence angle in radians.
 
+    Returns:
+        A float or a numpy array of floats representing the distance in focal units
+            the angles would be projected. Array elements whose angle is out of the
+            lens range are set to NaN.
+
+    Raises:
+        ValueError: If a float theta is out of the lens range.
     """
     if isinstance(theta, float):
         if theta < 0:
             raise ValueError("The angle theta cannot be negative")
-        if theta > to_radians(89):
+        if theta > _RECTILINEAR_MAX_THETA:
             raise ValueError(
                 "The Rectilinear lens can't handle FoV larger than 179 degrees"
             )
-        return np.tan(theta)
-    else:
-        invalid_bellow = theta < 0 
-        invalid_above = theta > to_radians(89)
-        invalid = np.logical_or(invalid_bellow, invalid_above)
-
-        results = np.tan(theta)
-        results[invalid] = np.nan
+        return _rectilinear_kernel(theta)
+
+    results = _rectilinear_kernel(theta)
+    # Checks the whole array range at once and only builds the invalid mask when
+    # some angle is actually out of range
+    if theta.size == 0 or (theta.min() >= 0 and theta.max() <= _RECTILINEAR_MAX_THETA):
         return results
 
+    invalid = np.logical_or(theta < 0, theta > _RECTILINEAR_MAX_THETA)
+    results[invalid] = np.nan
+    return results
+
+
 def _stereographic_inverse(projection_in_f_units: UniFloat) -> UniFloat:
     """Inverse stereographic function.
 
@@ -25,13 +25,14 @@ classes.
 
 """
 
-from typing import Protocol, Union, TypeVar, Tuple
+from typing import Callable, Protocol, Union, TypeVar, Tuple
 from abc import abstractmethod
 import numpy as np
 import numpy.typing as npt
 
-from photonbend.core._shared import make_complex
+from photonbend.core._shared import gather_pixels
 from photonbend.core.lens import Lens
+from photonbend.core.rotation import Rotation
 from photonbend.utils import to_radians
 
 UniFloat = TypeVar("UniFloat", float, npt.NDArray[np.float64])
@@ -66,7 +67,77 @@ class ProjectionImage(Protocol):
         ...
 
 
-class CameraImage(ProjectionImage):
+def _project_in_tiles(
+    destiny_image: npt.NDArray[np.uint8],
+    compute_coordinate_map: Callable[[int, int], npt.NDArray[np.float64]],
+    source: ProjectionImage,
+    rotation: Union[None, Rotation],
+    tile_rows: int,
+) -> npt.NDArray[np.uint8]:
+    """Maps a source image onto a destiny image, a band of rows at a time.
+
+    THIS IS NOT PART OF THE API - USE AT YOUR OWN RISK
+
+    Used by _TiledProjectionImage.project. compute_coordinate_map must return the
+    destiny coordinate map of the rows in [first_row, last_row).
+    """
+    height = destiny_image.shape[0]
+    for first_row in range(0, height, tile_rows):
+        last_row = min(first_row + tile_rows, height)
+        coordinate_map = compute_coordinate_map(first_row, last_row)
+        if rotation is not None:
+            coordinate_map = rotation.rotate_coordinate_map(coordinate_map)
+        destiny_image[first_row:last_row] = source.process_coordinate_map(
+            coordinate_map
+        )
+    return destiny_image
+
+
+class _TiledProjectionImage(ProjectionImage):
+    """Base of the projection classes, adding the tiled project method to them.
+
+    THIS IS NOT PART OF THE API - USE AT YOUR OWN RISK
+
+    Subclasses compute their coordinate map a band of rows at a time, which is what
+    lets project map a source image without building the whole map.
+    """
+
+    @abstractmethod
+    def _compute_coordinate_map(
+        self, first_row: int, last_row: int
+    ) -> npt.NDArray[np.float64]:
+        """Should return the coordinate map of the rows in [first_row, last_row)."""
+        ...
+
+    def project(
+        self,
+        source: ProjectionImage,
+        rotation: Union[None, Rotation] = None,
+        tile_rows: int = 64,
+    ) -> npt.NDArray[np.uint8]:
+        """Maps a source image onto this image, a band of rows at a time.
+
+        Does the same as rotating this image coordinate map and having the source
+        process it, but never holds more than tile_rows rows of coordinates in
+        memory, which keeps them in cache while they are rotated and processed.
+
+        *For more information on coordinate maps check the documentation for the
+        photonbend.core module.*
+
+        Args:
+            source (ProjectionImage): The image providing the pixels.
+            rotation (Rotation): An optional rotation applied to this image
+                coordinates before they are processed by the source.
+            tile_rows (int): How many rows are mapped at a time.
+        Returns:
+            This instance image, filled with the mapped pixels.
+        """
+        return _project_in_tiles(
+            self.image, self._compute_coordinate_map, source, rotation, tile_rows
+        )
+
+
+class CameraImage(_TiledProjectionImage):
     """Store and process camera-based images and their coordinates.
 
     This class maps each pixel of an image to a geodesic-like coordinate of the form
@@ -156,20 +227,24 @@ class CameraImage(ProjectionImage):
         Returns:
             A numpy array of float64 as a coordinate map.
         """
-        latitude, longitude = self._compute_latitude_longitude()
-        invalid = latitude > self.fov / 2
+        return self._compute_coordinate_map(0, self.image.shape[0])
 
-        latitude = latitude.reshape(*latitude.shape, 1)
-        longitude = longitude.reshape(*longitude.shape, 1)
-
-        invalid_float = invalid.astype(np.float64)
-        invalid_float = np.expand_dims(invalid_float, axis=2)
+    def _compute_coordinate_map(
+        self, first_row: int, last_row: int
+    ) -> npt.NDArray[np.float64]:
+        """Computes the coordinate map of the rows in [first_row, last_row)."""
+        latitude, longitude = self._compute_latitude_longitude(first_row, last_row)
+        invalid = latitude > self.fov / 2
 
-        coordinate_map = np.concatenate([latitude, longitude, invalid_float], 2)
+        # fills the map in place instead of stacking reshaped copies
+        coordinate_map = np.empty((*latitude.shape, 3), np.float64)
+        coordinate_map[:, :, 0] = latitude
+        coordinate_map[:, :, 1] = longitude
+        coordinate_map[:, :, 2] = invalid
         return coordinate_map
 
     def _compute_latitude_longitude(
-        self,
+        self, first_row: int, last_row: int
     ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         o_height, o_width = self.image.shape[:2]
 
@@ -177,20 +252,21 @@ class CameraImage(ProjectionImage):
         x_axis_range = np.linspace(-o_width / 2 + 0.5, o_width / 2 - 0.5, num=o_width)
         y_axis_range = np.linspace(
             o_height / 2 - 0.5, -o_height / 2 + 0.5, num=o_height
-        )
+        )[first_row:last_row]
         mesh_y, mesh_x = np.meshgrid(
             y_axis_range, x_axis_range, sparse=True, indexing="ij"
         )
 
         # uses euclidean distance to compute pixel distances from the center
-        distance_mesh = np.sqrt(mesh_x**2 + mesh_y**2) / self.f_distance
+        distance_mesh = np.hypot(mesh_x, mesh_y) / self.f_distance
 
         # uses the reverse lens function to get an angle of incidence for each pixel
-        latitude: npt.NDArray[np.float64] = self.reverse_lens(distance_mesh)
+        latitude = self.reverse_lens(distance_mesh)
 
-        # uses complex math to get the angle as used when using polar coordinates on the
-        # cartesian plane
-        longitude = np.log(make_complex(mesh_x, mesh_y)).imag
+        # gets the angle as used when using polar coordinates on the cartesian plane.
+        # It may differ in the last bit from the complex logarithm used before, which
+        # moves the odd position that lies right on a pixel border to its neighbour
+        longitude = np.arctan2(mesh_y, mesh_x)
         return latitude, longitude
 
     # Protocol implementation
@@ -211,52 +287,38 @@ class CameraImage(ProjectionImage):
             A new image based on the pixel data of this instance and the given
                 coordinate map.
         """
-        height, width = self.image.shape[:2]
-
-        invalid_map = coordinate_map[:, :, 2] != 0.0
         latitude = coordinate_map[:, :, 0]
         longitude = coordinate_map[:, :, 1]
 
         positions_x, positions_y = self._make_cartesian_map(latitude, longitude)
 
-        # removes bad positions in y
-        problem_positions_y = np.logical_or(positions_y >= height, positions_y < 0)
-        positions_y[problem_positions_y] = 0
-
-        # removes bad positions in x
-        problem_positions_x = np.logical_or(positions_x >= width, positions_x < 0)
-        positions_x[problem_positions_x] = 0
-
-        # makes a simplified map to set all bad positions to black
-        problem_positions_yx = np.logical_or(problem_positions_y, problem_positions_x)
-
-        # makes a new image
-        new_image_array = self.image[
-            positions_y,
-            positions_x,
-        ]
-
-        # sets all pixels with detected bad positions to black
-        new_image_array[problem_positions_yx] = 0
-
-        # set the invalid areas as set in the coordinate map to black
-        new_image_array[invalid_map] = 0
-
-        return new_image_array
+        # the invalid areas as set in the coordinate map and the positions outside
+        # this image are gathered as black pixels, so the new image needs no clean up
+        invalid_map = coordinate_map[:, :, 2] != 0.0
+        return gather_pixels(self.image, positions_y, positions_x, invalid_map)
 
     def _make_cartesian_map(self, latitude, longitude):
         image_center = self._get_image_center()
-        # Use valid values for the calculation. Must clean up later on!
-        # lat_long_map[invalid_map] = 0
+        # the positions are computed as separate x and y arrays with np.cos and
+        # np.sin rather than a complex exponential. They pick the pixels, so they
+        # stay in float64
         distance = self.forward_lens(latitude) * self.f_distance
-        unbalanced_cartesian_position = np.exp(longitude * 1j) * distance
-        # calculates the balanced positions
-        balanced_position_y = (
-            (unbalanced_cartesian_position.imag * (-1)) + image_center[0]
-        ).astype(int)
-        balanced_position_x = (
-            unbalanced_cartesian_position.real + image_center[1]
-        ).astype(int)
+        # calculates the balanced positions, truncating them straight into index
+        # buffers so no intermediate float arrays are allocated
+        balanced_position_y = np.empty(distance.shape, np.intp)
+        np.subtract(
+            image_center[0],
+            np.sin(longitude) * distance,
+            out=balanced_position_y,
+            casting="unsafe",
+        )
+        balanced_position_x = np.empty(distance.shape, np.intp)
+        np.add(
+            np.cos(longitude) * distance,
+            image_center[1],
+            out=balanced_position_x,
+            casting="unsafe",
+        )
         return balanced_position_x, balanced_position_y
 
     def _get_image_center(self):
@@ -274,7 +336,7 @@ class CameraImage(ProjectionImage):
         return np.array(self.image.shape[:2]) / 2 - 0.5
 
 
-class DoubleCameraImage(ProjectionImage):
+class DoubleCameraImage(_TiledProjectionImage):
     """Store and process 360 degrees camera-based images and their coordinates.
 
     This class maps each pixel of an image to a geodesic-like coordinate of the form
@@ -285,7 +347,9 @@ class DoubleCameraImage(ProjectionImage):
 
     Attributes:
         image (np.ndarray[int8]): The image as a numpy array with the shape
-            (height, width, 3).
+            (height, width, 3). Once coordinate maps are processed, copies of
+            both sensor images are kept, so it must not be changed in place;
+            assign a new array instead.
         fov (float): The image Field of View in radians for each sensor.
         lens (Lens): This image's lens instance.
         magnitude (float): The distance in pixels from the center of the image
@@ -315,6 +379,30 @@ class DoubleCameraImage(ProjectionImage):
         self.magnitude = self.image.shape[0] / 2.0
         self.f_distance = self._compute_f_distance()
 
+        self._sensor_cameras_image: Union[None, npt.NDArray[np.uint8]] = None
+        self._sensor_cameras: Tuple[CameraImage, CameraImage]
+
+    def _get_sensor_cameras(self) -> Tuple[CameraImage, CameraImage]:
+        """Gets the camera images of the left and right sensors.
+
+        The cameras are only rebuilt when a new array is assigned to image, so
+        mapping coordinate maps a tile at a time doesn't copy the sensors' images on
+        every call. The image is recognized by identity, so changes made to it in
+        place are not seen. The cameras hold copies of both halves of the image, and
+        their flattened pixels once they are used.
+        """
+        if self._sensor_cameras_image is not self.image:
+            width = self.image.shape[1] // 2
+            left_image_data = np.ascontiguousarray(self.image[:, :width])
+            right_image_data = np.ascontiguousarray(self.image[:, width:][:, ::-1])
+
+            self._sensor_cameras = (
+                CameraImage(left_image_data, self.sensor_fov, self.lens),
+                CameraImage(right_image_data, self.sensor_fov, self.lens),
+            )
+            self._sensor_cameras_image = self.image
+        return self._sensor_cameras
+
     def _compute_f_distance(self) -> float:
         """
         This method compute the f_distance (focal distance in pixels)
@@ -350,40 +438,45 @@ class DoubleCameraImage(ProjectionImage):
         Returns:
             A numpy array of float64 as a coordinate map.
         """
+        return self._compute_coordinate_map(0, self.image.shape[0])
 
-        latitude, longitude = self._compute_latitude_longitude()
+    def _compute_coordinate_map(
+        self, first_row: int, last_row: int
+    ) -> npt.NDArray[np.float64]:
+        """Computes the coordinate map of the rows in [first_row, last_row)."""
+        latitude, longitude = self._compute_latitude_longitude(first_row, last_row)
         half_width = self.image.shape[1] // 2
         # Maps the invalid areas
         invalid_map = latitude > self.sensor_fov / 2.0
         invalid_map[:, half_width:] = latitude[:, half_width:] < np.pi - (
             self.sensor_fov / 2.0
         )
-        latitude = latitude.reshape(*latitude.shape, 1)
-        longitude = longitude.reshape(*longitude.shape, 1)
-
-        invalid_float = invalid_map.astype(np.float64)
-        invalid_float = np.expand_dims(invalid_float, axis=2)
-
-        polar_coordinates = np.concatenate([latitude, longitude, invalid_float], 2)
+        # fills the map in place instead of stacking reshaped copies
+        polar_coordinates = np.empty((*latitude.shape, 3), np.float64)
+        polar_coordinates[:, :, 0] = latitude
+        polar_coordinates[:, :, 1] = longitude
+        polar_coordinates[:, :, 2] = invalid_map
         return polar_coordinates
 
-    def _compute_latitude_longitude(self):
+    def _compute_latitude_longitude(self, first_row: int, last_row: int):
         half_width = self.image.shape[1] // 2
 
         # making of 2 meshes
-        mesh_x, mesh_y = self._make_mesh()
-        distance_mesh = np.sqrt(mesh_x**2 + mesh_y**2) / self.f_distance
+        mesh_x, mesh_y = self._make_mesh(first_row, last_row)
+        distance_mesh = np.hypot(mesh_x, mesh_y) / self.f_distance
 
         # computes latitudes
-        latitude: npt.NDArray[np.float64] = self.reverse_lens(distance_mesh)
+        latitude = self.reverse_lens(distance_mesh)
 
         # image on the right has descending latitude (starts at Pi and reduces)
         latitude[:, half_width:] *= -1
         latitude[:, half_width:] += np.pi
-        longitude = np.log(make_complex(mesh_x, mesh_y)).imag
+        longitude = np.arctan2(mesh_y, mesh_x)
         return latitude, longitude
 
-    def _make_mesh(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    def _make_mesh(
+        self, first_row: int, last_row: int
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         original_height, original_width = self.image.shape[:2]
 
         half_width: int = original_width // 2
@@ -398,7 +491,7 @@ class DoubleCameraImage(ProjectionImage):
 
         y_axis_range = np.linspace(
             original_height / 2 - 0.5, -original_height / 2 + 0.5, num=original_height
-        )
+        )[first_row:last_row]
         mesh_y, mesh_x = np.meshgrid(
             y_axis_range, x_axis_range, sparse=True, indexing="ij"
         )
@@ -408,61 +501,60 @@ class DoubleCameraImage(ProjectionImage):
     def process_coordinate_map(
         self, coordinate_map: npt.NDArray[np.float64]
     ) -> npt.NDArray[np.uint8]:
-        # Calculate the shape for half of the image horizontally
-        real_height, real_width = self.image.shape[:2]
-        width = real_width // 2
-        fov_merger_ref = (self.sensor_fov / 2) - (np.pi / 2)
-        fov_merger_min = np.pi / 2 - fov_merger_ref
-        fov_merger_max = np.pi / 2 + fov_merger_ref
-        fov_merger_range = 2.0 * fov_merger_ref
-        fov_merger_safety = to_radians(0.5)  # a margin value on a fade gradient
-
         # Get the data from the passed coordinate map
         invalid_map = coordinate_map[:, :, 2] != 0.0
 
         left_coordinate_map = coordinate_map
 
-        right_coordinate_map = np.copy(coordinate_map)
-        right_coordinate_map[:, :, 0] *= -1
-        right_coordinate_map[:, :, 0] += np.pi
+        # the right sensor sees the latitudes mirrored around the equator
+        right_coordinate_map = np.empty_like(coordinate_map)
+        np.subtract(np.pi, coordinate_map[:, :, 0], out=right_coordinate_map[:, :, 0])
+        right_coordinate_map[:, :, 1:] = coordinate_map[:, :, 1:]
 
-        left_image_data = self.image[:, :width]
-        right_image_data = np.copy(self.image[:, width:])
-        right_image_data = right_image_data[:, ::-1]
-
-        left_cam_image = CameraImage(left_image_data, self.sensor_fov, self.lens)
-        right_cam_image = CameraImage(right_image_data, self.sensor_fov, self.lens)
+        left_cam_image, right_cam_image = self._get_sensor_cameras()
 
         left_mapping = left_cam_image.process_coordinate_map(left_coordinate_map)
         right_mapping = right_cam_image.process_coordinate_map(right_coordinate_map)
 
-        left_latitude = left_coordinate_map[:, :, 0]
-        left_merger_map = np.logical_and(
-            left_latitude >= fov_merger_min,
-            left_latitude <= (fov_merger_max + fov_merger_safety),
-        )
-        left_factor_map = (left_latitude - fov_merger_max) / fov_merger_range * -1
-        left_factor_map[np.logical_not(left_merger_map)] = 1.0
-        left_factor_map = np.expand_dims(left_factor_map, 2)
-        left_image = left_mapping.astype(np.float64) * (left_factor_map)
-
-        right_latitude = right_coordinate_map[:, :, 0]
-        right_merger_map = np.logical_and(
-            right_latitude >= fov_merger_min,
-            right_latitude <= (fov_merger_max + fov_merger_safety),
-        )
-        right_factor_map = (right_latitude - fov_merger_max) / fov_merger_range * -1
-        right_factor_map[np.logical_not(right_merger_map)] = 1.0
-        right_factor_map = np.expand_dims(right_factor_map, 2)
-        right_image = right_mapping.astype(np.float64) * (right_factor_map)
+        left_factor_map = self._compute_factor_map(left_coordinate_map[:, :, 0])
+        right_factor_map = self._compute_factor_map(right_coordinate_map[:, :, 0])
+        # a zero factor on both sides blacks out the invalid areas while blending,
+        # instead of masking the three channels of the final image
+        left_factor_map[invalid_map] = 0.0
+        right_factor_map[invalid_map] = 0.0
 
-        final_image = (left_image + right_image).astype(np.uint8)
-        final_image[invalid_map] = 0
+        # blends both sides into a single float buffer, multiplying the pixels by
+        # their factors without converting them to float first
+        blended_image = np.multiply(left_mapping, left_factor_map[:, :, np.newaxis])
+        blended_image += np.multiply(right_mapping, right_factor_map[:, :, np.newaxis])
 
-        return final_image
+        return blended_image.astype(np.uint8)
 
+    def _compute_factor_map(
+        self, latitude: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Computes the weight of a sensor for each latitude it maps.
+
+        The weight fades from 1 to 0 along the area both sensors see, so the
+        images of both sensors merge on a gradient instead of a seam.
+        """
+        fov_merger_ref = (self.sensor_fov / 2) - (np.pi / 2)
+        fov_merger_min = np.pi / 2 - fov_merger_ref
+        fov_merger_max = np.pi / 2 + fov_merger_ref
+        fov_merger_range = 2.0 * fov_merger_ref
+        fov_merger_safety = to_radians(0.5)  # a margin value on a fade gradient
 
-class PanoramaImage(ProjectionImage):
+        merger_map = latitude >= fov_merger_min
+        merger_map &= latitude <= (fov_merger_max + fov_merger_safety)
+
+        factor_map = (latitude - fov_merger_max) / fov_merger_range * -1
+        factor_map[np.logical_not(merger_map)] = 1.0
+        # the weights stay in float64, as rounding them to float32 moves the blend of
+        # the pixels that land right on a level boundary
+        return factor_map
+
+
+class PanoramaImage(_TiledProjectionImage):
     """Store and process equirectangular panorama images and their coordinates.
 
     This class maps each pixel of an image to a polar coordinates of the form
@@ -496,20 +588,25 @@ class PanoramaImage(ProjectionImage):
             A numpy ndarray of float64 as a coordinate map.
         """
 
+        return self._compute_coordinate_map(0, self.image.shape[0])
+
+    def _compute_coordinate_map(
+        self, first_row: int, last_row: int
+    ) -> npt.NDArray[np.float64]:
+        """Computes the coordinate map of the rows in [first_row, last_row)."""
         height, width = self.image.shape[:2]
         half_pi_element = np.pi / width / 2
 
         x_axis_range = np.linspace(
             -np.pi + half_pi_element, np.pi - half_pi_element, num=width
         )
-        y_axis_range = np.linspace(0, np.pi, num=height)
-        mesh_y, mesh_x = np.meshgrid(
-            y_axis_range, x_axis_range, sparse=False, indexing="ij"
-        )
-        mesh_y = mesh_y.reshape(*mesh_y.shape, 1)
-        mesh_x = mesh_x.reshape(*mesh_x.shape, 1)
-        invalid = np.zeros((*self.image.shape[:2], 1), np.float64)
-        coordinate_map = np.concatenate((mesh_y, mesh_x, invalid), axis=2)
+        y_axis_range = np.linspace(0, np.pi, num=height)[first_row:last_row]
+
+        # broadcasts the axes straight into the map instead of building full meshes
+        coordinate_map = np.empty((y_axis_range.size, width, 3), np.float64)
+        coordinate_map[:, :, 0] = y_axis_range[:, np.newaxis]
+        coordinate_map[:, :, 1] = x_axis_range
+        coordinate_map[:, :, 2] = 0.0
         return coordinate_map
 
     def process_coordinate_map(
@@ -533,18 +630,24 @@ class PanoramaImage(ProjectionImage):
         invalid_map = coordinate_map[:, :, 2] != 0.0
         polar_map = coordinate_map[:, :, :2]
 
-        polar_map[invalid_map] = 0
-
         height, width = self.image.shape[:2]
         width_pi_segment = np.pi / (width / 2)
         height_pi_segment = np.pi / height
 
-        latitude = polar_map[:, :, 0] / height_pi_segment
-        longitude = polar_map[:, :, 1] / width_pi_segment + (width / 2)
+        # scales the coordinates straight into index buffers and wraps them in
+        # place, so no intermediate float or integer arrays are allocated
+        rows = np.empty(invalid_map.shape, np.intp)
+        np.divide(polar_map[:, :, 0], height_pi_segment, out=rows, casting="unsafe")
+        rows %= height
+
+        columns = np.empty(invalid_map.shape, np.intp)
+        longitude = np.divide(polar_map[:, :, 1], width_pi_segment)
+        np.add(longitude, width / 2, out=columns, casting="unsafe")
+        columns %= width
 
-        image = self.image[latitude.astype(int) % height, longitude.astype(int) % width]
-        image[invalid_map] = 0
-        return image
+        # the invalid pixels are gathered as black pixels, whatever their coordinates,
+        # so the coordinate map is left untouched and the new image needs no clean up
+        return gather_pixels(self.image, rows, columns, invalid_map)
 
 
 def map_projection(
@@ -21,8 +21,6 @@
 import numpy as np
 import numpy.typing as npt
 
-from photonbend.core._shared import make_complex
-
 
 def _calculate_rotation_matrix(
     pitch: float, yaw: float, roll: float
@@ -99,6 +97,42 @@ class Rotation:
         """
         self.rotation_matrix = _calculate_rotation_matrix(-pitch, -yaw, -roll)
 
+    @classmethod
+    def from_matrix(cls, rotation_matrix: npt.NDArray[np.float64]) -> "Rotation":
+        """Creates a rotation out of a rotation matrix.
+
+        The matrix is used as given: it is not checked to be orthonormal, and one
+        that isn't would scale or skew the coordinates instead of rotating them.
+
+        Args:
+            rotation_matrix (np.ndarray): A 3x3 rotation matrix, as the one held
+                by the rotation_matrix attribute.
+        Returns:
+            A new rotation that applies the given matrix.
+        """
+        # initializes as a rotation by no angles, then takes the given matrix
+        rotation = cls(0.0, 0.0, 0.0)
+        rotation.rotation_matrix = np.asarray(rotation_matrix, dtype=np.float64)
+        return rotation
+
+    def compose(self, *others: "Rotation") -> "Rotation":
+        """Composes this rotation with other ones.
+
+        Multiplies the rotation matrices, so a chain of rotations can be applied
+        to a coordinate map in a single pass.
+
+        Args:
+            others (Rotation): The rotations to be applied after this one, in the
+                order they are applied.
+        Returns:
+            A new rotation equivalent to applying this rotation and then the others.
+        """
+        rotation_matrix = self.rotation_matrix
+        for other in others:
+            rotation_matrix = other.rotation_matrix @ rotation_matrix
+
+        return type(self).from_matrix(rotation_matrix)
+
     def rotate_coordinate_map(
         self, coordinate_map: npt.NDArray[np.float64]
     ) -> npt.NDArray[np.float64]:
@@ -124,53 +158,33 @@ class Rotation:
         invalid_map = coordinate_map[:, :, 2] != 0.0
         polar_map[invalid_map] = 0
 
-        # Convert the polar coordinate map into 3 maps representing 3D
-        # coordinates (x, y, z)
-        y = np.cos(latitude)
-        xz = np.exp(longitude * 1j) * np.sin(latitude)
-        x = xz.real
-        z = xz.imag
-
-        # Concatenate the elements to produce a single map
-        x = np.expand_dims(x, axis=2)
-        y = np.expand_dims(y, axis=2)
-        z = np.expand_dims(z, axis=2)
-        position_vector: npt.NDArray[np.float64] = np.concatenate([x, y, z], axis=2)
-        # Expands the dimensions to use fast matrix multiplication
-        position_vector = np.expand_dims(position_vector, axis=3)
-
-        # Does the rotation using matrix multiplication in the last two axis of
-        # both matrices, which works really fast
-        new_position_vector = np.matmul(
-            self.rotation_matrix,
-            position_vector,
-            axes=[
-                (-2, -1),
-                (-2, -1),
-                (-2, -1),
-            ],
-        )
-        new_position_vector = new_position_vector.reshape(
-            new_position_vector.shape[:-1]
+        # Convert the polar coordinate map into a map of 3D coordinates (x, y, z),
+        # filling each component in place. The angles pick the pixels sampled later
+        # on, so they are kept in float64
+        sin_latitude = np.sin(latitude)
+        position_vector = np.empty(coordinate_map.shape, np.float64)
+        np.multiply(np.cos(longitude), sin_latitude, out=position_vector[:, :, 0])
+        np.cos(latitude, out=position_vector[:, :, 1])
+        np.multiply(np.sin(longitude), sin_latitude, out=position_vector[:, :, 2])
+
+        # Does the rotation of every vector with a single (H*W, 3) x (3, 3) matrix
+        # multiplication, which BLAS runs much faster than a 3x3 product per pixel
+        new_position_vector = np.empty_like(position_vector)
+        np.matmul(
+            position_vector.reshape(-1, 3),
+            self.rotation_matrix.T,
+            out=new_position_vector.reshape(-1, 3),
         )
 
-        # Turn the 3D map back into a polar coordinate map
-        translated_latitude = np.arccos(new_position_vector[:, :, 1])
-        translated_xz = make_complex(
-            new_position_vector[:, :, 0], new_position_vector[:, :, 2]
+        # Turn the 3D map back into a polar coordinate map, filling it in place
+        ans = np.empty(coordinate_map.shape, np.float64)
+        np.arccos(new_position_vector[:, :, 1], out=ans[:, :, 0])
+        # the longitude is the angle of (x, z), which is all the imaginary part of
+        # a complex logarithm would give, without computing the logarithm itself
+        np.arctan2(
+            new_position_vector[:, :, 2], new_position_vector[:, :, 0], out=ans[:, :, 1]
         )
-
-        # TODO Check if warning suppression is needed here
-        translated_longitude = np.log(translated_xz).imag
-
-        translated_latitude = np.expand_dims(translated_latitude, axis=2)
-        translated_longitude = np.expand_dims(translated_longitude, axis=2)
-        new_invalid_map = np.expand_dims(invalid_map, axis=2)
-
-        pre_ans = np.concatenate([translated_latitude, translated_longitude], axis=2)
         # cleans the data before returning to ensure all other functions will work
-        pre_ans[invalid_map] = 0
-
-        # concatenate the invalid map to the back of pre_ans to complete the data
-        ans = np.concatenate([pre_ans, new_invalid_map], axis=2)
+        ans[invalid_map, :2] = 0
+        ans[:, :, 2] = invalid_map
         return ans
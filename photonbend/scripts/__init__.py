@@ -20,11 +20,16 @@
 
 __doc__ = """
     # Scripts
-    When photonbend is installed, it sets up a script named photonbend with 3 different
+    When photonbend is installed, it sets up a script named photonbend with 5 different
     commands to help you deal with your images.
      - [make-photo](#make-photo)
      - [alter-photo](#alter-photo)
      - [make-pano](#make-pano)
+     - [batch-alter](#batch-alter)
+     - [batch-pano](#batch-pano)
+
+    Every command asks before overwriting an existing file. Use `-y`/`--yes` to
+    overwrite them without being asked, as when running from scripts.
 
     ## Parameters
     The commands have a common theme among them.
@@ -159,6 +164,41 @@ __doc__ = """
     photonbend make-pano --type inscribed --lens equidistant --fov 360 \\
     --rotation -90 0 90 equidistant.jpg panorama.jpg
     ```
+
+    ## batch-alter
+    This tool works like alter-photo, but changes many photos at once using the same
+    options. The destiny photos are saved on a directory, using the same file names as
+    the source photos, so no two source photos may share a file name. Only JPG and
+    PNG photos are processed, and any other file is skipped with a warning. Photos
+    are processed in parallel; use `--jobs` to limit how many are processed at the
+    same time.
+
+    #### Change the lens of many photos
+    The example below changes the lenses of every `jpg` photo on the current directory
+    from `equidistant` projection to `equisolid` projection, saving them on the
+    `equisolid` directory.
+
+    ```
+    photonbend batch-alter --itype inscribed --otype inscribed --ilens equidistant \\
+    --olens equisolid --ifov 360 --ofov 360 *.jpg equisolid
+    ```
+
+    ## batch-pano
+    This tool works like make-pano, but makes panoramas out of many photos at once
+    using the same options. The panoramas are saved on a directory, using the same
+    file names as the source photos, so no two source photos may share a file name.
+    As in batch-alter, photos are processed in parallel; use `--jobs` to limit how
+    many are processed at the same time.
+
+    #### Make panoramas out of many photos
+    The example below makes a panorama out of every `jpg` photo on the current
+    directory, taken with an `equidistant` lens and an FoV of `360` degrees, saving
+    them on the `panoramas` directory.
+
+    ```
+    photonbend batch-pano --type inscribed --lens equidistant --fov 360 *.jpg \\
+    panoramas
+    ```
     """
 
 from typing import List
@@ -18,14 +18,26 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Tuple, Literal, Optional, Final
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Literal,
+    Optional,
+    Final,
+    Sequence,
+    Union,
+)
 
 import click
 import numpy as np
-from PIL import Image
 from numpy import typing as npt
 
 from photonbend.core.lens import (
@@ -38,6 +50,7 @@ from photonbend.core.lens import (
 )
 
 from photonbend.core.projection import DoubleCameraImage, CameraImage
+from photonbend.core.rotation import Rotation
 
 # Some literal types that will be used on many commands
 from photonbend.utils import to_radians
@@ -50,16 +63,19 @@ CamLensStr = Literal[
 ]
 
 
-def _verify_output_path(output: Path):
+ImageSuffixes: Final[Tuple[str, ...]] = (".jpg", ".jpeg", ".png")
+
+
+def _verify_output_path(output: Path, overwrite: bool = False):
     out = Path(output)
-    if not (out.suffix.lower() in [".jpg", ".jpeg", ".png"]):
+    if not (out.suffix.lower() in ImageSuffixes):
         print("The desired output image should be a JPG or PNG file.")
         print(
             "Provide an output filename ending in either JPG, JPEG or PNG (case insensitive)"  # noqa E501
         )
         print("Exiting!")
         sys.exit(1)
-    if out.exists():
+    if not overwrite and out.exists():
         while True:
             ans = input("File already exists. Overwrite? (y/n) ")
             if ans in ["y", "n"]:
@@ -70,8 +86,8 @@ def _verify_output_path(output: Path):
     return out
 
 
-def _euclidean_distance(x, y):
-    return np.sqrt(x**2 + y**2)
+def _euclidean_distance(x: float, y: float) -> float:
+    return float(np.hypot(x, y))
 
 
 class CameraImageType(IntEnum):
@@ -81,6 +97,22 @@ class CameraImageType(IntEnum):
     DOUBLE_INSCRIBED = auto()
 
 
+_IMAGE_TYPES: Final[Dict[CamImgTypeStr, CameraImageType]] = {
+    "inscribed": CameraImageType.INSCRIBED,
+    "double": CameraImageType.DOUBLE_INSCRIBED,
+    "cropped": CameraImageType.CROPPED_CIRCLE,
+    "full": CameraImageType.FULL_FRAME,
+}
+
+_LENS_FACTORIES: Final[Dict[CamLensStr, Callable[[], Lens]]] = {
+    "equidistant": equidistant,
+    "equisolid": equisolid,
+    "orthographic": orthographic,
+    "rectilinear": rectilinear,
+    "stereographic": stereographic,
+}
+
+
 def _get_camera(cam_img_type: CameraImageType):
     if cam_img_type is CameraImageType.DOUBLE_INSCRIBED:
         return DoubleCameraImage
@@ -110,32 +142,23 @@ def _calculate_magnitude(image_type: CameraImageType, shape: Tuple[int, ...]) ->
 
 
 def _process_image_type(type: CamImgTypeStr) -> CameraImageType:
-    types_dict = {
-        "inscribed": CameraImageType.INSCRIBED,
-        "double": CameraImageType.DOUBLE_INSCRIBED,
-        "cropped": CameraImageType.CROPPED_CIRCLE,
-        "full": CameraImageType.FULL_FRAME,
-    }
-
-    return types_dict[type]
+    return _IMAGE_TYPES[type]
 
 
 def _process_lens(lens: CamLensStr) -> Lens:
-    lens_types = {
-        "equidistant": equidistant,
-        "equisolid": equisolid,
-        "orthographic": orthographic,
-        "rectilinear": rectilinear,
-        "stereographic": stereographic,
-    }
-
-    return lens_types[lens]()
+    return _LENS_FACTORIES[lens]()
 
 
 def _open_image(input_image) -> npt.NDArray[np.uint8]:
+    # Pillow is only imported when an image is actually read or written, so
+    # commands that never touch one, like --help, start without loading it
+    from PIL import Image
+
     try:
         with Image.open(input_image) as image:
-            source_array: npt.NDArray[np.unit8] = np.asarray(image)  # type: ignore
+            # Pillow exports its pixels as a single bytes buffer, which asarray
+            # wraps without copying them again
+            source_array: npt.NDArray[np.uint8] = np.asarray(image, dtype=np.uint8)
     except IOError:
         print("Error: Input image could not be opened!")
         print("Exiting!")
@@ -143,6 +166,37 @@ def _open_image(input_image) -> npt.NDArray[np.uint8]:
     return source_array
 
 
+def _read_image_shape(input_image) -> Tuple[int, int, int]:
+    """Reads the shape an image will have once opened, from its header only."""
+    from PIL import Image
+
+    try:
+        with Image.open(input_image) as image:
+            width, height = image.size
+    except IOError:
+        print("Error: Input image could not be opened!")
+        print("Exiting!")
+        sys.exit(1)
+    return height, width, Channels
+
+
+def _save_image(image_array: npt.NDArray[np.uint8], output: Path) -> None:
+    from PIL import Image
+
+    image = Image.fromarray(image_array)
+    try:
+        if output.suffix.lower() == ".png":
+            # PNG is lossless at any level; the fastest one takes a fraction of the
+            # time of the default one in exchange for slightly bigger files
+            image.save(output, compress_level=1)
+        else:
+            image.save(output)
+    except IOError:
+        print("Could not save to the specified location!")
+        print("Exiting!")
+        sys.exit(1)
+
+
 # Help messages that are used on many commands
 
 lens_choices = click.Choice(
@@ -167,6 +221,8 @@ rotation_help = """
     This is a 3-valued parameter in the form <pitch yaw roll>
     """
 
+overwrite_help = "Overwrite existing output files without asking."
+
 
 def _process_fov(fov: float, image_type: CameraImageType):
     if image_type is CameraImageType.DOUBLE_INSCRIBED and fov < 180:
@@ -177,10 +233,114 @@ def _process_fov(fov: float, image_type: CameraImageType):
     return r_fov
 
 
+def _compose_rotation(
+    rotation: Sequence[Tuple[float, float, float]],
+) -> Optional[Rotation]:
+    """Composes rotations given in degrees into a single one.
+
+    Lets the commands rotate the coordinate map once, no matter how many rotations
+    were asked for. Returns None when there is no rotation to apply.
+    """
+    if not rotation:
+        return None
+    # converts every angle in a single call
+    angles = to_radians(np.asarray(rotation, dtype=np.float64))
+    first, *others = [Rotation(*rot) for rot in angles]
+    return first.compose(*others)
+
+
+def _make_source_image(
+    source_array: npt.NDArray[np.uint8],
+    itype: CamImgTypeStr,
+    ilens: CamLensStr,
+    ifov: float,
+) -> Union[CameraImage, DoubleCameraImage]:
+    source_type = _process_image_type(itype)
+    source_lens = _process_lens(ilens)
+    source_magnitude = _calculate_magnitude(source_type, source_array.shape)
+    source_fov = _process_fov(ifov, source_type)
+    return _get_camera(source_type)(
+        source_array, source_fov, source_lens, magnitude=source_magnitude
+    )
+
+
+def _run_batch(
+    make_coordinate_map: Callable[[Tuple[int, ...]], npt.NDArray[np.float64]],
+    process_image: Callable[[Path, Path, npt.NDArray[np.float64]], None],
+    input_images: Tuple[Path, ...],
+    output_dir: Path,
+    jobs: Optional[int],
+    overwrite: bool = False,
+) -> None:
+    """Processes many images at once, saving them on output_dir.
+
+    process_image is called with the path of each input image, the path of its
+    output, which has the same file name, in output_dir, and the coordinate map of
+    the output. Input images sharing a file name would overwrite each other's
+    output, so they are refused upfront. The outputs can only be saved as JPG or PNG
+    files, so input images of other formats are skipped with a warning.
+
+    The coordinate map depends only on the shape of the input image, so
+    make_coordinate_map is called once for each shape, before the images of that
+    shape are processed, and its map is shared by all of them.
+    """
+    for image in input_images:
+        if image.suffix.lower() not in ImageSuffixes:
+            print(f"Skipping {image}: only JPG and PNG images can be processed.")
+    input_images = tuple(
+        image for image in input_images if image.suffix.lower() in ImageSuffixes
+    )
+
+    repeated_names = [
+        name
+        for name, count in Counter(image.name for image in input_images).items()
+        if count > 1
+    ]
+    if repeated_names:
+        raise click.UsageError(
+            "Input images are saved on the output directory by their file names, "
+            "which must be unique. Repeated: " + ", ".join(sorted(repeated_names))
+        )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Verifies every output upfront, so any question is asked before processing
+    outputs = [
+        _verify_output_path(output_dir / image.name, overwrite)
+        for image in input_images
+    ]
+
+    # groups the images by the shape read from their headers, so each map is built
+    # once, in this thread, and only one map is kept at a time
+    images_by_shape: Dict[Tuple[int, int, int], List[Tuple[Path, Path]]] = {}
+    for input_image, output_image in zip(input_images, outputs):
+        shape = _read_image_shape(input_image)
+        images_by_shape.setdefault(shape, []).append((input_image, output_image))
+
+    # NumPy and Pillow release the GIL on their heavy loops, so threads process
+    # the images in parallel without copying them between processes
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        for shape, images in images_by_shape.items():
+            coordinate_map = make_coordinate_map(shape)
+            futures = [
+                executor.submit(
+                    process_image, input_image, output_image, coordinate_map
+                )
+                for input_image, output_image in images
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # stops at the first failure instead of processing every other image
+                for future in futures:
+                    future.cancel()
+                raise
+
+
 def _calculate_destiny_size(
-    image_type: CameraImageType, source_image: npt.NDArray, height: Optional[int]
+    image_type: CameraImageType, source_shape: Tuple[int, ...], height: Optional[int]
 ) -> Tuple[int, int, int]:
-    local_height = source_image.shape[0]
+    local_height = source_shape[0]
     if height is not None:
         local_height = height
 
@@ -18,21 +18,20 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
-import sys
 from pathlib import Path
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Union
 
 import click
 import numpy as np
-from PIL import Image
+import numpy.typing as npt
 
-from photonbend.utils import to_radians
 from . import (
     _verify_output_path,
     _calculate_magnitude,
     _process_image_type,
     _process_lens,
     _open_image,
+    _save_image,
     CamImgTypeStr,
     CamLensStr,
     lens_choices,
@@ -40,12 +39,14 @@ from . import (
     type_choices_help,
     double_type_fov_warning,
     rotation_help,
+    overwrite_help,
     _process_fov,
     _get_camera,
+    _compose_rotation,
     _calculate_destiny_size,
+    _make_source_image,
 )
-from photonbend.core.projection import ProjectionImage
-from photonbend.core.rotation import Rotation
+from photonbend.core.projection import CameraImage, DoubleCameraImage
 
 
 @click.argument("input_image", type=click.Path(exists=True, path_type=Path))
@@ -105,6 +106,14 @@ from photonbend.core.rotation import Rotation
     default=None,
     help="The vertical size of the destiny image",
 )
+@click.option(
+    "-y",
+    "--yes",
+    "overwrite",
+    is_flag=True,
+    default=False,
+    help=overwrite_help,
+)
 def alter_photo(
     input_image: Path,
     itype: CamImgTypeStr,
@@ -116,6 +125,7 @@ def alter_photo(
     output_image: Path,
     rotation: List[Tuple[float, float, float]],
     size: Optional[int],
+    overwrite: bool,
 ) -> None:
     """Change the the lens and FoV of a photo.
 
@@ -123,40 +133,70 @@ def alter_photo(
     INPUT is the path to the source photo.
     OUTPUT is the desired path of the destiny photo.
     """
-    out = _verify_output_path(output_image)
+    out = _verify_output_path(output_image, overwrite)
 
     # Opens the image or finish the application if there is no image
     source_array = _open_image(input_image)
-    source_type = _process_image_type(itype)
-    source_lens = _process_lens(ilens)
-    source_magnitude = _calculate_magnitude(source_type, source_array.shape)
-    source_fov = _process_fov(ifov, source_type)
-    source_image: ProjectionImage = _get_camera(source_type)(
-        source_array, source_fov, source_lens, magnitude=source_magnitude
+    mapped_array = _alter_photo_array(
+        source_array, itype, ilens, ifov, otype, olens, ofov, rotation, size
     )
+    _save_image(mapped_array, out)
 
+
+def _alter_photo_array(
+    source_array: npt.NDArray[np.uint8],
+    itype: CamImgTypeStr,
+    ilens: CamLensStr,
+    ifov: float,
+    otype: CamImgTypeStr,
+    olens: CamLensStr,
+    ofov: float,
+    rotation: List[Tuple[float, float, float]],
+    size: Optional[int],
+) -> npt.NDArray[np.uint8]:
+    """Maps a source photo array to the destiny photo described by the options."""
+    source_image = _make_source_image(source_array, itype, ilens, ifov)
+    destiny_image = _make_destiny_image(source_array.shape, otype, olens, ofov, size)
+    return destiny_image.project(source_image, _compose_rotation(rotation))
+
+
+def _alter_photo_coordinate_map(
+    source_shape: Tuple[int, ...],
+    otype: CamImgTypeStr,
+    olens: CamLensStr,
+    ofov: float,
+    rotation: List[Tuple[float, float, float]],
+    size: Optional[int],
+) -> npt.NDArray[np.float64]:
+    """Gets the rotated coordinate map of the destiny photo described by the options.
+
+    The map depends only on the source shape and the options, never on the pixels,
+    so photos of the same shape can share it and only have their pixels mapped.
+    """
+    destiny_image = _make_destiny_image(source_shape, otype, olens, ofov, size)
+    coordinate_map = destiny_image.get_coordinate_map()
+    composed_rotation = _compose_rotation(rotation)
+    if composed_rotation is not None:
+        coordinate_map = composed_rotation.rotate_coordinate_map(coordinate_map)
+    # the map is shared by every photo, so nothing may change it
+    coordinate_map.flags.writeable = False
+    return coordinate_map
+
+
+def _make_destiny_image(
+    source_shape: Tuple[int, ...],
+    otype: CamImgTypeStr,
+    olens: CamLensStr,
+    ofov: float,
+    size: Optional[int],
+) -> Union[CameraImage, DoubleCameraImage]:
     destiny_type = _process_image_type(otype)
-    destiny_shape = _calculate_destiny_size(destiny_type, source_array, height=size)
-    destiny_array = np.zeros(destiny_shape, np.uint8)
+    destiny_shape = _calculate_destiny_size(destiny_type, source_shape, height=size)
+    # project writes every pixel of the destiny, so it doesn't need zeroing
+    destiny_array = np.empty(destiny_shape, np.uint8)
     destiny_lens = _process_lens(olens)
-    destiny_magnitude = _calculate_magnitude(destiny_type, source_array.shape)
+    destiny_magnitude = _calculate_magnitude(destiny_type, source_shape)
     destiny_fov = _process_fov(ofov, destiny_type)
-    destiny_image: ProjectionImage = _get_camera(cam_img_type=destiny_type)(
+    return _get_camera(cam_img_type=destiny_type)(
         destiny_array, destiny_fov, destiny_lens, magnitude=destiny_magnitude
     )
-    destiny_map = destiny_image.get_coordinate_map()
-
-    for rot in rotation:
-        rad_rotation = tuple(map(to_radians, rot))
-        rotation_transform = Rotation(*rad_rotation)
-        destiny_map = rotation_transform.rotate_coordinate_map(destiny_map)
-
-    mapped_array = source_image.process_coordinate_map(destiny_map)
-    mapped_image = Image.fromarray(mapped_array)
-
-    try:
-        mapped_image.save(out)
-    except IOError:
-        print("Could not save to the specified location!")
-        print("Exiting!")
-        sys.exit(1)
@@ -0,0 +1,165 @@
+#  Copyright (c) 2022. Edson Moreira
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+from pathlib import Path
+from typing import Tuple, List, Optional
+
+import click
+import numpy as np
+from numpy import typing as npt
+
+from . import (
+    _make_source_image,
+    _run_batch,
+    _open_image,
+    _save_image,
+    CamImgTypeStr,
+    CamLensStr,
+    lens_choices,
+    type_choices,
+    type_choices_help,
+    double_type_fov_warning,
+    rotation_help,
+    overwrite_help,
+)
+from .alter_photo import _alter_photo_coordinate_map
+
+
+@click.argument(
+    "input_images",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "--itype",
+    required=True,
+    help="The type of the input images. " + type_choices_help,
+    type=type_choices,
+)
+@click.option(
+    "--ilens",
+    required=True,
+    help="The lens type that was used on the input photos.",
+    type=lens_choices,
+)
+@click.option(
+    "--ifov",
+    required=True,
+    type=click.FLOAT,
+    help="The lens field of view of the input photos in degrees. "
+    + double_type_fov_warning,
+)
+@click.option(
+    "--otype",
+    required=True,
+    help="The type of the output images." + type_choices_help,
+    type=type_choices,
+)
+@click.option(
+    "--olens",
+    required=True,
+    help="The lens type to be used on the output photos. " + double_type_fov_warning,
+    type=lens_choices,
+)
+@click.option(
+    "--ofov",
+    required=True,
+    type=click.FLOAT,
+    help="The lens field of view of the output photos in degrees.",
+)
+@click.argument(
+    "output_dir", type=click.Path(file_okay=False, writable=True, path_type=Path)
+)
+@click.option(
+    "-r",
+    "--rotation",
+    required=False,
+    type=click.FLOAT,
+    nargs=3,
+    default=[],
+    help=rotation_help,
+    multiple=True,
+)
+@click.option(
+    "-s",
+    "--size",
+    required=False,
+    type=click.INT,
+    default=None,
+    help="The vertical size of the destiny images",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    required=False,
+    type=click.IntRange(min=1),
+    default=None,
+    help="How many photos to process at the same time. Defaults to the number of "
+    "CPUs.",
+)
+@click.option(
+    "-y",
+    "--yes",
+    "overwrite",
+    is_flag=True,
+    default=False,
+    help=overwrite_help,
+)
+def batch_alter(
+    input_images: Tuple[Path, ...],
+    itype: CamImgTypeStr,
+    ilens: CamLensStr,
+    ifov: float,
+    otype: CamImgTypeStr,
+    olens: CamLensStr,
+    ofov: float,
+    output_dir: Path,
+    rotation: List[Tuple[float, float, float]],
+    size: Optional[int],
+    jobs: Optional[int],
+    overwrite: bool,
+) -> None:
+    """Change the lens and FoV of many photos at once.
+
+    All the photos are processed with the same options, as in alter-photo.
+
+    \b
+    INPUT_IMAGES are the paths to the source photos.
+    OUTPUT_DIR is the directory where the destiny photos are saved, using the
+    same file names as the source photos, which must be unique.
+    """
+
+    def make_coordinate_map(source_shape: Tuple[int, ...]) -> npt.NDArray[np.float64]:
+        return _alter_photo_coordinate_map(
+            source_shape, otype, olens, ofov, rotation, size
+        )
+
+    def alter_one(
+        input_image: Path, output_image: Path, coordinate_map: npt.NDArray[np.float64]
+    ) -> None:
+        source_array = _open_image(input_image)
+        source_image = _make_source_image(source_array, itype, ilens, ifov)
+        mapped_array = source_image.process_coordinate_map(coordinate_map)
+        _save_image(mapped_array, output_image)
+
+    _run_batch(
+        make_coordinate_map, alter_one, input_images, output_dir, jobs, overwrite
+    )
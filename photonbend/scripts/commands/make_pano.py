@@ -19,22 +19,18 @@
 #  SOFTWARE.
 
 
-import sys
 from pathlib import Path
-from typing import Tuple, List, Optional, Final
+from typing import Tuple, List, Optional
 
 import click
 import numpy as np
 import numpy.typing as npt
-from PIL import Image
 
-from photonbend.utils import to_radians
 from . import (
     _verify_output_path,
-    _calculate_magnitude,
-    _process_image_type,
-    _process_lens,
+    _make_source_image,
     _open_image,
+    _save_image,
     CamImgTypeStr,
     CamLensStr,
     lens_choices,
@@ -42,13 +38,11 @@ from . import (
     type_choices_help,
     double_type_fov_warning,
     rotation_help,
-    _process_fov,
-    _get_camera,
+    overwrite_help,
+    _compose_rotation,
+    Channels,
 )
 from photonbend.core.projection import PanoramaImage
-from photonbend.core.rotation import Rotation
-
-Channels: Final[int] = 3
 
 
 @click.argument("input_image", type=click.Path(exists=True, path_type=Path))
@@ -91,6 +85,14 @@ Channels: Final[int] = 3
     help="The vertical size of the destiny image",
 )
 @click.argument("output_image", type=click.Path(exists=False, path_type=Path))
+@click.option(
+    "-y",
+    "--yes",
+    "overwrite",
+    is_flag=True,
+    default=False,
+    help=overwrite_help,
+)
 def make_pano(
     input_image: Path,
     itype: CamImgTypeStr,
@@ -99,6 +101,7 @@ def make_pano(
     output_image: Path,
     rotation: List[Tuple[float, float, float]],
     size: Optional[int],
+    overwrite: bool,
 ) -> None:
     """Make a panorama out of a photo.
 
@@ -106,44 +109,46 @@ def make_pano(
     INPUT is the path to the source photo.
     OUTPUT is the desired path of the destiny panorama.
     """
-    out = _verify_output_path(output_image)
+    out = _verify_output_path(output_image, overwrite)
 
     # Opens the image or finish the application if there is no image
     source_array = _open_image(input_image)
-    source_type = _process_image_type(itype)
-    source_lens = _process_lens(lens)
-    source_magnitude = _calculate_magnitude(source_type, source_array.shape)
-    source_fov = _process_fov(fov, source_type)
-    source_image = _get_camera(source_type)(
-        source_array, source_fov, source_lens, magnitude=source_magnitude
-    )
+    source_image = _make_source_image(source_array, itype, lens, fov)
 
-    destiny_shape = _calculate_destiny_size(source_array, size)
-    destiny_array = np.zeros(destiny_shape, np.uint8)
+    destiny_shape = _calculate_destiny_size(source_array.shape, size)
+    # project writes every pixel of the destiny, so it doesn't need zeroing
+    destiny_array = np.empty(destiny_shape, np.uint8)
     destiny_image = PanoramaImage(destiny_array)
-    destiny_map = destiny_image.get_coordinate_map()
+    mapped_array = destiny_image.project(source_image, _compose_rotation(rotation))
+    _save_image(mapped_array, out)
 
-    for rot in rotation:
-        rad_rotation = tuple(map(to_radians, rot))
-        rotation_transform = Rotation(*rad_rotation)
-        destiny_map = rotation_transform.rotate_coordinate_map(destiny_map)
 
-    mapped_array = source_image.process_coordinate_map(destiny_map)
-    mapped_image = Image.fromarray(mapped_array)
+def _make_pano_coordinate_map(
+    source_shape: Tuple[int, ...],
+    rotation: List[Tuple[float, float, float]],
+    size: Optional[int],
+) -> npt.NDArray[np.float64]:
+    """Gets the rotated coordinate map of the panorama described by the options.
 
-    try:
-        mapped_image.save(out)
-    except IOError:
-        print("Could not save to the specified location!")
-        print("Exiting!")
-        sys.exit(1)
+    The map depends only on the source shape and the options, never on the pixels,
+    so photos of the same shape can share it and only have their pixels mapped.
+    """
+    destiny_shape = _calculate_destiny_size(source_shape, size)
+    destiny_image = PanoramaImage(np.empty(destiny_shape, np.uint8))
+    coordinate_map = destiny_image.get_coordinate_map()
+    composed_rotation = _compose_rotation(rotation)
+    if composed_rotation is not None:
+        coordinate_map = composed_rotation.rotate_coordinate_map(coordinate_map)
+    # the map is shared by every photo, so nothing may change it
+    coordinate_map.flags.writeable = False
+    return coordinate_map
 
 
 def _calculate_destiny_size(
-    source_image: npt.NDArray, height: Optional[int]
+    source_shape: Tuple[int, ...], height: Optional[int]
 ) -> Tuple[int, int, int]:
-    local_height = source_image.shape[0]
+    local_height = source_shape[0]
     if height is not None:
         local_height = height
 
-    return local_height, int(local_height * 2), Channels
+    return local_height, 2 * local_height, Channels
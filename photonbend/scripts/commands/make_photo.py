@@ -19,21 +19,19 @@
 #  SOFTWARE.
 
 
-import sys
 from pathlib import Path
 from typing import Tuple, List, Optional
 
 import click
 import numpy as np
-from PIL import Image
 
-from photonbend.utils import to_radians
 from . import (
     _verify_output_path,
     _calculate_magnitude,
     _process_image_type,
     _process_lens,
     _open_image,
+    _save_image,
     CamImgTypeStr,
     CamLensStr,
     lens_choices,
@@ -41,12 +39,13 @@ from . import (
     type_choices_help,
     double_type_fov_warning,
     rotation_help,
+    overwrite_help,
     _process_fov,
     _get_camera,
+    _compose_rotation,
     _calculate_destiny_size,
 )
 from photonbend.core.projection import PanoramaImage
-from photonbend.core.rotation import Rotation
 
 
 @click.argument("input_image", type=click.Path(exists=True, path_type=Path))
@@ -89,6 +88,14 @@ from photonbend.core.rotation import Rotation
     help="The vertical size of the destiny image",
 )
 @click.argument("output_image", type=click.Path(exists=False, path_type=Path))
+@click.option(
+    "-y",
+    "--yes",
+    "overwrite",
+    is_flag=True,
+    default=False,
+    help=overwrite_help,
+)
 def make_photo(
     input_image: Path,
     otype: CamImgTypeStr,
@@ -97,6 +104,7 @@ def make_photo(
     output_image: Path,
     rotation: List[Tuple[float, float, float]],
     size: Optional[int],
+    overwrite: bool,
 ) -> None:
     """Make a photo out of a panorama.
 
@@ -104,38 +112,28 @@ def make_photo(
     INPUT is the path to the source panorama.
     OUTPUT is the desired path of the destiny photo.
     """
-    out = _verify_output_path(output_image)
+    out = _verify_output_path(output_image, overwrite)
 
     # Opens the image or finish the application if there is no image
     source_array = _open_image(input_image)
     source_image = PanoramaImage(source_array)
-    s_height, s_width, _ = source_array.shape
 
     destiny_type = _process_image_type(otype)
-    destiny_shape = _calculate_destiny_size(destiny_type, source_array, height=size)
+    destiny_shape = _calculate_destiny_size(
+        destiny_type, source_array.shape, height=size
+    )
     destiny_lens = _process_lens(lens)
 
     destiny_magnitude = _calculate_magnitude(destiny_type, destiny_shape)
     destiny_fov = _process_fov(fov, destiny_type)
+    # project writes every pixel of the destiny, so it doesn't need zeroing
+    destiny_array = np.empty(destiny_shape, np.uint8)
     destiny_image = _get_camera(destiny_type)(
-        np.zeros(destiny_shape, np.int8),
+        destiny_array,
         destiny_fov,
         destiny_lens,
         magnitude=destiny_magnitude,
     )
-    destiny_map = destiny_image.get_coordinate_map()
-
-    for rot in rotation:
-        rad_rotation = tuple(map(to_radians, rot))
-        rotation_transform = Rotation(*rad_rotation)
-        destiny_map = rotation_transform.rotate_coordinate_map(destiny_map)
-
-    mapped_array = source_image.process_coordinate_map(destiny_map)
-    mapped_image = Image.fromarray(np.copy(mapped_array))
 
-    try:
-        mapped_image.save(out)
-    except IOError:
-        print("Could not save to the specified location!")
-        print("Exiting!")
-        sys.exit(1)
+    mapped_array = destiny_image.project(source_image, _compose_rotation(rotation))
+    _save_image(mapped_array, out)
@@ -20,6 +20,8 @@
 
 import click
 from .commands.alter_photo import alter_photo
+from .commands.batch_alter import batch_alter
+from .commands.batch_pano import batch_pano
 
 from .commands.make_pano import make_pano
 from .commands.make_photo import make_photo
@@ -33,3 +35,5 @@ def main():
 main.command()(make_pano)
 main.command()(alter_photo)
 main.command()(make_photo)
+main.command()(batch_alter)
+main.command()(batch_pano)
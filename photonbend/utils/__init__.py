@@ -20,61 +20,72 @@
 
 __doc__ = "Some simple utility functions are available here."
 
-from typing import Tuple, Callable
+import math
+from functools import lru_cache
+from typing import Tuple, Callable, TypeVar
 import numpy as np
+import numpy.typing as npt
 
+UniFloat = TypeVar("UniFloat", float, npt.NDArray[np.float64])
 
-def to_radians(degrees: float) -> float:
+
+def to_radians(degrees: UniFloat) -> UniFloat:
     """Convert degrees to radians
 
     Args:
-        degrees: A float representing an angle in degrees
+        degrees: A float or an array of floats representing angles in degrees
 
     Returns:
-        A float representing the same angle in radians.
+        The same angles in radians.
     """
 
     return degrees / 180 * np.pi
 
 
-def to_degrees(radians: float) -> float:
+def to_degrees(radians: UniFloat) -> UniFloat:
     """Convert radians to degrees
 
     Args:
-        radians: A float representing an angle in radians
+        radians: A float or an array of floats representing angles in radians
 
     Returns:
-        A float representing the same angle in degrees.
+        The same angles in degrees.
     """
 
     return radians / np.pi * 180.0
 
 
-def _panorama_to_photo_size_horizontal(
-    panorama_width: int, lens_function: Callable[[float], float]
-) -> Tuple[float, float]:
-    """Helper functions - not stable"""
+@lru_cache(maxsize=8)
+def _lens_f_factor(lens_function: Callable[[float], float]) -> float:
+    """Helper function - not stable
+
+    The ratio between the distances a lens projects angles of Pi and Pi/2 to.
+    It only depends on the lens, so it is cached per lens function. There are only
+    a handful of lenses, so a small bound keeps every one of them cached.
+    """
 
     half_pi_f_radius = lens_function(np.pi / 2)
     pi_f_radius = lens_function(np.pi)
-    f_factor = pi_f_radius / half_pi_f_radius
+    return pi_f_radius / half_pi_f_radius
+
+
+def _panorama_to_photo_size_horizontal(
+    panorama_width: int, f_factor: float
+) -> Tuple[float, float]:
+    """Helper functions - not stable"""
 
     pano_half_pi_diameter = panorama_width / np.pi
-    photo_diameter = int(np.ceil(pano_half_pi_diameter * f_factor))
+    photo_diameter = math.ceil(pano_half_pi_diameter * f_factor)
     return (photo_diameter,) * 2
 
 
 def _panorama_to_photo_size_vertical(
-    panorama_height: int, lens_function: Callable[[float], float]
+    panorama_height: int, f_factor: float
 ) -> Tuple[float, float]:
     """Helper function - not stable"""
 
-    half_pi_f_radius = lens_function(np.pi / 2)
-    pi_f_radius = lens_function(np.pi)
-    f_factor = pi_f_radius / half_pi_f_radius
-
     small_side_factor = 1.0 / (1.0 - f_factor if f_factor > 0.5 else f_factor)
-    photo_diameter = abs(int(np.ceil(panorama_height * small_side_factor)))
+    photo_diameter = abs(math.ceil(panorama_height * small_side_factor))
     return (photo_diameter,) * 2
 
 
@@ -107,12 +118,11 @@ def calculate_size_panorama_to_photo(
         width == 2 * height
     ), "Equirectangular panoramas should have width and height in a 2:1 proportion"
 
-    photo_size = _panorama_to_photo_size_horizontal(width, lens_function=lens_function)
+    f_factor = _lens_f_factor(lens_function)
+    photo_size = _panorama_to_photo_size_horizontal(width, f_factor)
 
     if preserve_vertical_resolution:
-        v_photo_size = _panorama_to_photo_size_vertical(
-            height, lens_function=lens_function
-        )
+        v_photo_size = _panorama_to_photo_size_vertical(height, f_factor)
         if v_photo_size > photo_size:
             return v_photo_size
     return photo_size
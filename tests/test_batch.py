@@ -0,0 +1,179 @@
+#   Copyright (c) 2022. Edson Moreira
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+
+from pathlib import Path
+from typing import List, Tuple
+
+import click
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from PIL import Image
+
+from photonbend.scripts.commands import _run_batch
+from photonbend.scripts.main import main
+
+
+def _write_image(path: Path, height: int, width: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pixels = np.random.default_rng(0).integers(0, 256, (height, width, 3), np.uint8)
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+class _Recorder:
+    """Stands for the callbacks of _run_batch, recording how they were called."""
+
+    def __init__(self) -> None:
+        self.shapes: List[Tuple[int, ...]] = []
+        self.processed: List[Tuple[Path, Path, Tuple[int, ...]]] = []
+
+    def make_coordinate_map(self, shape):
+        self.shapes.append(shape)
+        return np.zeros(shape)
+
+    def process_image(self, input_image, output_image, coordinate_map):
+        self.processed.append((input_image, output_image, coordinate_map.shape))
+        output_image.touch()
+
+
+def test_run_batch_builds_one_map_per_shape(tmp_path):
+    images = (
+        _write_image(tmp_path / "in" / "a.png", 4, 6),
+        _write_image(tmp_path / "in" / "b.jpg", 5, 5),
+        _write_image(tmp_path / "in" / "c.png", 4, 6),
+    )
+    recorder = _Recorder()
+
+    _run_batch(
+        recorder.make_coordinate_map,
+        recorder.process_image,
+        images,
+        tmp_path / "out",
+        jobs=2,
+    )
+
+    assert sorted(recorder.shapes) == [(4, 6, 3), (5, 5, 3)]
+    assert sorted(recorder.processed) == [
+        (images[0], tmp_path / "out" / "a.png", (4, 6, 3)),
+        (images[1], tmp_path / "out" / "b.jpg", (5, 5, 3)),
+        (images[2], tmp_path / "out" / "c.png", (4, 6, 3)),
+    ]
+
+
+def test_run_batch_refuses_repeated_names(tmp_path):
+    images = (
+        _write_image(tmp_path / "first" / "a.png", 4, 4),
+        _write_image(tmp_path / "second" / "a.png", 4, 4),
+    )
+    recorder = _Recorder()
+
+    with pytest.raises(click.UsageError, match="a.png"):
+        _run_batch(
+            recorder.make_coordinate_map,
+            recorder.process_image,
+            images,
+            tmp_path / "out",
+            jobs=1,
+        )
+    assert recorder.processed == []
+
+
+def test_run_batch_skips_unsupported_images(tmp_path, capsys):
+    images = (
+        _write_image(tmp_path / "in" / "a.png", 4, 4),
+        _write_image(tmp_path / "in" / "b.tif", 4, 4),
+    )
+    recorder = _Recorder()
+
+    _run_batch(
+        recorder.make_coordinate_map,
+        recorder.process_image,
+        images,
+        tmp_path / "out",
+        jobs=1,
+    )
+
+    assert [processed[0] for processed in recorder.processed] == [images[0]]
+    assert "b.tif" in capsys.readouterr().out
+
+
+def test_run_batch_overwrites_when_asked_to(tmp_path, monkeypatch):
+    images = (_write_image(tmp_path / "in" / "a.png", 4, 4),)
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.png").touch()
+    monkeypatch.setattr("builtins.input", pytest.fail)
+    recorder = _Recorder()
+
+    _run_batch(
+        recorder.make_coordinate_map,
+        recorder.process_image,
+        images,
+        tmp_path / "out",
+        jobs=1,
+        overwrite=True,
+    )
+
+    assert len(recorder.processed) == 1
+
+
+def test_run_batch_stops_when_overwriting_is_refused(tmp_path, monkeypatch):
+    images = (_write_image(tmp_path / "in" / "a.png", 4, 4),)
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.png").touch()
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+    recorder = _Recorder()
+
+    with pytest.raises(SystemExit):
+        _run_batch(
+            recorder.make_coordinate_map,
+            recorder.process_image,
+            images,
+            tmp_path / "out",
+            jobs=1,
+        )
+    assert recorder.processed == []
+
+
+def test_batch_alter_matches_alter_photo(tmp_path):
+    images = [
+        _write_image(tmp_path / "in" / "a.png", 40, 40),
+        _write_image(tmp_path / "in" / "b.png", 30, 30),
+    ]
+    options = "--itype inscribed --ilens equidistant --ifov 180 --otype full "
+    options += "--olens rectilinear --ofov 120 -r 10 20 5 -y"
+    runner = CliRunner()
+
+    result = runner.invoke(
+        main,
+        ["batch-alter", *options.split(), *map(str, images), str(tmp_path / "batch")],
+    )
+    assert result.exit_code == 0, result.output
+
+    for image in images:
+        single = tmp_path / ("single_" + image.name)
+        result = runner.invoke(
+            main, ["alter-photo", *options.split(), str(image), str(single)]
+        )
+        assert result.exit_code == 0, result.output
+        np.testing.assert_array_equal(
+            np.asarray(Image.open(tmp_path / "batch" / image.name)),
+            np.asarray(Image.open(single)),
+        )
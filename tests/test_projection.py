@@ -0,0 +1,70 @@
+#   Copyright (c) 2022. Edson Moreira
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+
+import numpy as np
+import pytest
+
+from photonbend.core.lens import equisolid, rectilinear
+from photonbend.core.projection import CameraImage, DoubleCameraImage, PanoramaImage
+from photonbend.core.rotation import Rotation
+
+
+def _random_image(height: int, width: int) -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 256, (height, width, 3), np.uint8)
+
+
+def _destinies():
+    return [
+        CameraImage(_random_image(37, 37), np.radians(180), equisolid()),
+        CameraImage(_random_image(37, 50), np.radians(100), rectilinear()),
+        DoubleCameraImage(_random_image(37, 74), np.radians(200), equisolid()),
+        PanoramaImage(_random_image(37, 74)),
+    ]
+
+
+@pytest.mark.parametrize("destiny", _destinies())
+@pytest.mark.parametrize("rotation", [None, Rotation(0.3, -0.2, 0.1)])
+def test_project_matches_processing_the_whole_map(destiny, rotation):
+    source = PanoramaImage(_random_image(60, 120))
+    coordinate_map = destiny.get_coordinate_map()
+    if rotation is not None:
+        coordinate_map = rotation.rotate_coordinate_map(coordinate_map)
+    expected = source.process_coordinate_map(coordinate_map)
+
+    # 37 rows don't split evenly in tiles of 8
+    projected = destiny.project(source, rotation, tile_rows=8)
+
+    np.testing.assert_array_equal(projected, expected)
+
+
+def test_processing_leaves_the_coordinate_map_untouched():
+    destiny = DoubleCameraImage(_random_image(20, 40), np.radians(200), equisolid())
+    coordinate_map = Rotation(0.3, 0.2, 0.1).rotate_coordinate_map(
+        destiny.get_coordinate_map()
+    )
+    coordinate_map.flags.writeable = False
+    sources = [
+        PanoramaImage(_random_image(30, 60)),
+        CameraImage(_random_image(30, 30), np.radians(180), equisolid()),
+        DoubleCameraImage(_random_image(30, 60), np.radians(200), equisolid()),
+    ]
+
+    for source in sources:
+        assert source.process_coordinate_map(coordinate_map).shape == (20, 40, 3)
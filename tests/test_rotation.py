@@ -0,0 +1,67 @@
+#   Copyright (c) 2022. Edson Moreira
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+
+import numpy as np
+
+from photonbend.core.rotation import Rotation
+
+
+def test_compose_applies_the_other_rotations_after_this_one():
+    first = Rotation(0.3, 0.0, 0.0)
+    second = Rotation(0.0, 0.5, 0.0)
+    third = Rotation(0.0, 0.0, -0.7)
+
+    composed = first.compose(second, third)
+
+    expected = third.rotation_matrix @ second.rotation_matrix @ first.rotation_matrix
+    np.testing.assert_allclose(composed.rotation_matrix, expected)
+
+
+def test_compose_rotates_maps_as_the_rotations_in_sequence():
+    first = Rotation(0.3, 0.2, 0.0)
+    second = Rotation(-0.1, 0.0, 0.4)
+    latitude, longitude = np.meshgrid(
+        np.linspace(0.1, 3.0, 9), np.linspace(-3.0, 3.0, 11), indexing="ij"
+    )
+    coordinate_map = np.stack([latitude, longitude, np.zeros_like(latitude)], axis=-1)
+
+    composed = first.compose(second).rotate_coordinate_map(coordinate_map)
+    in_sequence = second.rotate_coordinate_map(
+        first.rotate_coordinate_map(coordinate_map)
+    )
+
+    np.testing.assert_allclose(composed, in_sequence, atol=1e-9)
+
+
+def test_compose_keeps_the_rotation_class():
+    class MyRotation(Rotation):
+        pass
+
+    composed = MyRotation(0.1, 0.2, 0.3).compose(Rotation(0.3, 0.2, 0.1))
+
+    assert type(composed) is MyRotation
+
+
+def test_from_matrix_uses_the_given_matrix():
+    rotation_matrix = Rotation(0.1, 0.2, 0.3).rotation_matrix
+
+    rotation = Rotation.from_matrix(rotation_matrix)
+
+    np.testing.assert_array_equal(rotation.rotation_matrix, rotation_matrix)
@@ -0,0 +1,47 @@
+#   Copyright (c) 2022. Edson Moreira
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+
+import numpy as np
+
+from photonbend.core._shared import gather_pixels
+
+
+def test_gather_pixels_matches_fancy_indexing():
+    image = np.arange(4 * 5 * 3, dtype=np.uint8).reshape(4, 5, 3)
+    rows = np.array([[0, 3], [2, 1]], np.intp)
+    columns = np.array([[4, 0], [2, 3]], np.intp)
+
+    np.testing.assert_array_equal(
+        gather_pixels(image, rows, columns), image[rows, columns]
+    )
+
+
+def test_gather_pixels_blacks_out_of_bounds_and_masked_positions():
+    image = np.full((4, 5, 3), 255, np.uint8)
+    rows = np.array([-1, 4, 0, 1, 2], np.intp)
+    columns = np.array([0, 0, -1, 5, 2], np.intp)
+    black_map = np.array([False, False, False, False, True])
+
+    pixels = gather_pixels(image, rows, columns, black_map)
+
+    np.testing.assert_array_equal(pixels, np.zeros((5, 3), np.uint8))
+    np.testing.assert_array_equal(
+        gather_pixels(image, rows[4:], columns[4:]), np.full((1, 3), 255, np.uint8)
+    )